@@ -21,6 +21,7 @@ import sys
 import logging
 import argparse
 
+from logolang import codegen, compiler, lexer, lexer_fast, symtable
 from logolang.syntrans import parse_program
 from logolang.symtable import push_scope, add_symbol
 from logolang.logolib import initialize_standard_library
@@ -56,6 +57,10 @@ def parse_command_line():
     logging.basicConfig(format=log_format, level=level)
     logging.addLevelName(3, "LEXER")
     logging.addLevelName(5, "PARSER")
+    # The compiler modules cache their trace flags; re-arm them now
+    # that the log level is known.
+    for module in (lexer, lexer_fast, symtable, codegen, compiler):
+        module.refresh_trace()
     return options.filename
 
 
@@ -74,12 +79,7 @@ def main():
                 code_gen()
                 return 0
             return 1
-    except (
-        logolang.errors.LogoLexerError,
-        logolang.errors.LogoParserError,
-        logolang.errors.LogoLinkerError,
-        logolang.errors.InternalError,
-    ) as error:
+    except logolang.errors.LogoError as error:
         print(str(error), file=sys.stderr)
         return 1
 
@@ -19,13 +19,147 @@
 
 # pylint: disable=too-few-public-methods
 
+import itertools
 import logging
-from collections import namedtuple
+import string
+import sys
 import operator
 
-from logolang.symtable import get_symbol
+from logolang.symtable import resolve_function
 from logolang.errors import LogoLinkerError, InternalError
 
+# Check the parser trace level once, so code generation does not pay for
+# disabled logging calls on every node; refresh_trace() re-arms it after
+# the CLI configures logging.
+_TRACE = logging.getLogger().isEnabledFor(5)
+
+
+def refresh_trace():
+    """Re-evaluate the cached trace flag after logging configuration."""
+    global _TRACE  # pylint: disable=global-statement
+    _TRACE = logging.getLogger().isEnabledFor(5)
+
+
+# Opcode tables are built once, at module load, instead of on every
+# emit() call.  Opcodes are interned so comparisons and dict probes in
+# later passes are pointer operations.
+_BINARY_OPS = {
+    op: tuple(sys.intern(instr) for instr in instrs)
+    for op, instrs in {
+        "+": ("ADD",),
+        "-": ("SUB",),
+        "*": ("MUL",),
+        "/": ("DIV",),
+        "%": ("IDIV", "POP"),
+        "^": ("POW",),
+    }.items()
+}
+
+# Constant-folding tables, shared by the 'value' properties.
+_FOLD_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+    "^": operator.pow,
+}
+
+_REL_FOLD = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "<>": operator.ne,
+}
+
+_ASSIGN_OPS = {
+    "+": sys.intern("ADD"),
+    "-": sys.intern("SUB"),
+    "*": sys.intern("MUL"),
+    "/": sys.intern("DIV"),
+    "^": sys.intern("POW"),
+}
+
+_REL_TEST = {
+    "<": {
+        "ifTrue": ("JLESS :{true}",),
+        "ifFalse": ("JMORE :{false}", "JZ :{false}"),
+    },
+    "<=": {
+        "ifTrue": ("JLESS :{true}", "JZ :{true}"),
+        "ifFalse": ("JMORE :{false}",),
+    },
+    ">": {
+        "ifTrue": ("JMORE :{true}",),
+        "ifFalse": ("JLESS :{false}", "JZ :{false}"),
+    },
+    ">=": {
+        "ifTrue": ("JMORE :{true}", "JZ :{true}"),
+        "ifFalse": ("JLESS :{false}",),
+    },
+    "==": {
+        "ifTrue": ("JZ :{true}",),
+        "ifFalse": ("JNZ :{false}",),
+    },
+    "<>": {
+        "ifTrue": ("JNZ :{true}",),
+        "ifFalse": ("JZ :{false}",),
+    },
+}
+
+
+_FORMATTER = string.Formatter()
+
+
+def _parse_templates(code_block):
+    """Parse instruction templates into (literal, field) segment tuples."""
+    return [
+        tuple(_FORMATTER.parse(instr))
+        for instr in code_block
+        if isinstance(instr, str)
+    ]
+
+
+def _render_template(segments, values):
+    """Assemble one instruction from parsed segments and field values."""
+    pieces = []
+    for literal, field, spec, conversion in segments:
+        if literal:
+            pieces.append(literal)
+        if field is not None:
+            obj, _ = _FORMATTER.get_field(field, (), values)
+            if conversion:
+                obj = _FORMATTER.convert_field(obj, conversion)
+            pieces.append(format(obj, spec or ""))
+    return "".join(pieces)
+
+
+def _load_instr(symbol):
+    """Return the LOAD instruction for a symbol, caching it on the symbol."""
+    instr = symbol.get("_load")
+    if instr is None:
+        instr = symbol["_load"] = sys.intern(f"LOAD {symbol['fqsn']}")
+    return instr
+
+
+def _stor_instr(symbol):
+    """Return the STOR instruction for a symbol, caching it on the symbol."""
+    instr = symbol.get("_stor")
+    if instr is None:
+        instr = symbol["_stor"] = sys.intern(f"STOR {symbol['fqsn']}")
+    return instr
+
+
+def _call_instr(symbol):
+    """Return the CALL instruction for a symbol, caching it on the symbol."""
+    instr = symbol.get("_call")
+    if instr is None:
+        called = symbol.get("target") or symbol["name"]
+        instr = symbol["_call"] = sys.intern(f"CALL {called}")
+    return instr
+
 
 def format_value(value, value_type):
     """Format value."""
@@ -36,21 +170,42 @@ def format_value(value, value_type):
     return value
 
 
-class NoOp:
-    """A NoOp operation."""
+class CodeNode:
+    """Base class for nodes that emit code into a shared buffer."""
 
-    @staticmethod
-    def gen_code():
+    __slots__ = ()
+
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        raise InternalError(
+            f"emit() not implemented for {self.__class__.__name__}."
+        )
+
+    def gen_code(self):
         """Generate code for LogoVM."""
-        return []
+        code = []
+        self.emit(code)
+        return code
+
+
+class NoOp(CodeNode):
+    """A NoOp operation."""
 
+    __slots__ = ()
 
-class ConstValue(namedtuple("ConstValue", "value datatype")):
+    def emit(self, code):
+        """Emit code for LogoVM."""
+
+
+class ConstValue(CodeNode):
     """Constant/Literal value implementation."""
 
-    def __new__(cls, *args, **kwargs):
-        """Initialize the namedtuple."""
-        return super().__new__(cls, *args, **kwargs)
+    __slots__ = ("value", "datatype")
+
+    def __init__(self, value, datatype):
+        """Initialize object."""
+        self.value = value
+        self.datatype = datatype
 
     @property
     def type(self):
@@ -62,14 +217,16 @@ class ConstValue(namedtuple("ConstValue", "value datatype")):
         """Return True if value is const."""
         return True
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        return [f"PUSH {self.value}"]
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        code.append(f"PUSH {self.value}")
 
 
-class ReferenceValue:
+class ReferenceValue(CodeNode):
     """Reference to value (variable) implementation."""
 
+    __slots__ = ("symbol",)
+
     def __init__(self, symbol):
         """Initialize object."""
         self.symbol = symbol
@@ -78,9 +235,10 @@ class ReferenceValue:
         """Retrieve a string representation of the object."""
         return f"<ReferenceValue: {self.symbol['name']}>"
 
-    def __getattr__(self, key):
-        """Return a value as a property."""
-        return self.symbol.get(key)
+    @property
+    def name(self):
+        """Return the symbol name."""
+        return self.symbol["name"]
 
     @property
     def type(self):
@@ -92,26 +250,31 @@ class ReferenceValue:
         """Return True if value is const."""
         return False
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        scope = self.symbol["scope"]
-        return (
-            [f"LOAD {scope}.{self.symbol['name']}"]
-            if scope
-            else [f"LOAD {self.symbol['name']}"]
-        )
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        code.append(_load_instr(self.symbol))
 
 
-class BinaryOperator(namedtuple("BinaryOperator", "op lhs rhs")):
+class BinaryOperator(CodeNode):
     """Arithmetic binary operator implementation."""
 
-    def __new__(cls, op, lhs, rhs):
-        """Initialize namedtuple."""
+    __slots__ = ("op", "lhs", "rhs", "_const_value")
+
+    def __init__(self, op, lhs, rhs):
+        """Initialize object, folding constant operands eagerly."""
         if str in (lhs.type, rhs.type):
             raise InternalError("Operations for 'str' not available.")
         if lhs.type != rhs.type and bool in (lhs.type, rhs.type):
             raise InternalError("Invalid operation with 'bool' and 'number'.")
-        return super().__new__(cls, op, lhs, rhs)
+        self.op = op
+        self.lhs = lhs
+        self.rhs = rhs
+        if lhs.is_const and rhs.is_const:
+            operation = _FOLD_OPS.get(op)
+            if operation is None:
+                self._const_value = self.type()
+            else:
+                self._const_value = operation(lhs.value, rhs.value)
 
     @property
     def type(self):
@@ -132,39 +295,26 @@ class BinaryOperator(namedtuple("BinaryOperator", "op lhs rhs")):
         """Return the expression value."""
         if not self.is_const:
             raise InternalError("Acessing 'value' of non-const expression.")
-        operation = {}
-        if self.is_const:
-            operation = {
-                "+": operator.add,
-                "-": operator.sub,
-                "*": operator.mul,
-                "/": operator.truediv,
-                "%": operator.mod,
-                "^": operator.pow,
-            }
-        return operation.get(self.op, lambda _l, _r: self.type())(
-            self.lhs.value, self.rhs.value
-        )
+        return self._const_value
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        operators = {
-            "+": ["ADD"],
-            "-": ["SUB"],
-            "*": ["MUL"],
-            "/": ["DIV"],
-            "%": ["IDIV", "POP"],
-            "^": ["POW"],
-        }
-        return self.lhs.gen_code() + self.rhs.gen_code() + operators[self.op]
-
-
-class AssignOperator(namedtuple("AssignOperator", "oper lhs rhs datatype")):
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        self.lhs.emit(code)
+        self.rhs.emit(code)
+        code.extend(_BINARY_OPS[self.op])
+
+
+class AssignOperator(CodeNode):
     """Assignment operator implementation."""
 
-    def __new__(cls, *args, **kwargs):
-        """Initialize namedtuple."""
-        return super().__new__(cls, *args, **kwargs)
+    __slots__ = ("oper", "lhs", "rhs", "datatype")
+
+    def __init__(self, oper, lhs, rhs, datatype):
+        """Initialize object."""
+        self.oper = oper
+        self.lhs = lhs
+        self.rhs = rhs
+        self.datatype = datatype
 
     @property
     def type(self):
@@ -176,37 +326,42 @@ class AssignOperator(namedtuple("AssignOperator", "oper lhs rhs datatype")):
         """Return True if value is const."""
         return self.rhs.is_const
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
+    def emit(self, code):
+        """Emit code for LogoVM."""
         # Do operations over "Fully Qualified Scope Name" (fqsn).
-        operators = {
-            "+": [f"LOAD {self.lhs['fqsn']}", "ADD"],
-            "-": [f"LOAD {self.lhs['fqsn']}", "SUB"],
-            "*": [f"LOAD {self.lhs['fqsn']}", "MUL"],
-            "/": [f"LOAD {self.lhs['fqsn']}", "DIV"],
-            "^": [f"LOAD {self.lhs['fqsn']}", "POW"],
-        }
-        code = operators.get(self.oper[0], [])
-        code = code[:1] + self.rhs.gen_code() + code[1:]
-        code.append(f"STOR {self.lhs['fqsn']}")
-        return code
+        oper = _ASSIGN_OPS.get(self.oper[0])
+        if oper:
+            code.append(_load_instr(self.lhs))
+        self.rhs.emit(code)
+        if oper:
+            code.append(oper)
+        code.append(_stor_instr(self.lhs))
 
 
-class CallParam(namedtuple("CallParam", "param inout")):
+class CallParam(CodeNode):
     """Parameters for calling functions."""
 
-    def __new__(cls, param, inout="in", **kwargs):
-        """Initialize namedtuple."""
-        return super().__new__(cls, param, inout, **kwargs)
+    __slots__ = ("param", "inout", "_code")
+
+    def __init__(self, param, inout="in"):
+        """Initialize object, precomputing the emitted code."""
+        self.param = param
+        self.inout = inout
+        # "output" parameters emit nothing; symbol parameters emit a
+        # fixed LOAD; expression parameters defer to the node.
+        if inout == "out":
+            self._code = ()
+        elif hasattr(param, "emit"):
+            self._code = None
+        else:
+            self._code = (sys.intern(f"LOAD {param['name']}"),)
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        # Parameter is an "output" paramater ()
-        if self.inout == "out":
-            return []
-        if hasattr(self.param, "gen_code"):
-            return self.param.gen_code()
-        return f"LOAD {self.param['name']}"
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        if self._code is None:
+            self.param.emit(code)
+        else:
+            code.extend(self._code)
 
     @property
     def name(self):
@@ -214,21 +369,18 @@ class CallParam(namedtuple("CallParam", "param inout")):
         return self.param["name"]
 
 
-class CallProcedure:
+class CallProcedure(CodeNode):
     """Calling an existing procedure."""
 
+    __slots__ = ("symbol", "params", "type", "is_const")
+
     def __init__(self, symbol, params=None, **kwargs):
         """Initialize object."""
-
-        def get_func(name):
-            _func = get_symbol(name)
-            if _func is None:
-                raise LogoLinkerError(f"Cannot resolve function '{name}'.")
-            if "alias" in _func:
-                return get_func(_func["alias"])
-            return _func
-
-        self.symbol = get_func(symbol["name"])
+        name = symbol["name"]
+        func = resolve_function(name)
+        if func is None:
+            raise LogoLinkerError(f"Cannot resolve function '{name}'.")
+        self.symbol = func
         self.params = params or []
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -241,46 +393,63 @@ class CallProcedure:
     # def is_const(self):
     #     return self.symbol.get("is_const")
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
+    def emit(self, code):
+        """Emit code for LogoVM."""
 
-        def format_instr(code_block):
-            result = []
-            for instr in code_block:
-                if isinstance(instr, str):
-                    result.append(
-                        instr.format(
-                            params=self.params, params_len=len(self.params)
-                        )
-                    )
-            return result
+        def format_instr(kind):
+            parsed = self.symbol.get(f"_{kind}_parsed")
+            if parsed is None:
+                parsed = self.symbol[f"_{kind}_parsed"] = _parse_templates(
+                    self.symbol.get(kind, [])
+                )
+            if parsed:
+                values = {
+                    "params": self.params,
+                    "params_len": len(self.params),
+                }
+                code.extend(
+                    _render_template(instr, values) for instr in parsed
+                )
 
-        code = []
-        for param in self.params[
-            :: -1 if self.symbol.get("reverse_args", False) else 1
-        ]:
-            code.extend(param.gen_code())
-        code.extend(format_instr(self.symbol.get("precode", [])))
-        called = self.symbol.get("target") or self.symbol.get(
-            "name", self.symbol["name"]
-        )
-        code.append(f"CALL {called}")
-        code.extend(format_instr(self.symbol.get("postcode", [])))
-        return code
+        params = self.params
+        if self.symbol.get("reverse_args", False):
+            params = reversed(params)
+        for param in params:
+            param.emit(code)
+        format_instr("precode")
+        code.append(_call_instr(self.symbol))
+        format_instr("postcode")
 
 
-class FunctionDefinition(namedtuple("FunctionDefinition", "symbol code")):
+class FunctionDefinition(CodeNode):
     """A new primitive definition."""
 
-    def __new__(cls, symbol, code):
-        """Initialize namedtuple."""
-        return super().__new__(cls, symbol, code)
+    __slots__ = ("symbol", "code", "_parsed")
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
+    def __init__(self, symbol, code):
+        """Initialize object."""
+        self.symbol = symbol
+        self.code = code
+        # String entries are templates over the symbol entry; split
+        # them into segments once here, so emit() appends static
+        # instructions directly and only renders the templated ones.
+        parsed = []
+        for entry in code:
+            if isinstance(entry, str):
+                segments = tuple(_FORMATTER.parse(entry))
+                if any(field is not None for _, field, _, _ in segments):
+                    parsed.append(segments)
+                else:
+                    parsed.append("".join(literal for literal, *_ in segments))
+            else:
+                parsed.append(entry)
+        self._parsed = parsed
+
+    def emit(self, code):
+        """Emit code for LogoVM."""
         symbol = self.symbol
         if symbol.get("internal", False):
-            return []
+            return
         if not symbol["usage"] > 0:
             if not symbol.get("library", False):
                 logging.info(
@@ -288,28 +457,31 @@ class FunctionDefinition(namedtuple("FunctionDefinition", "symbol code")):
                     symbol["name"],
                     symbol.get("lineno", 0),
                 )
-            return []
-        # print("FUN:", symbol['name'])
-        code = ["", f"DEF {symbol['name']}:"]
+            return
+        code.append("")
+        code.append(f"DEF {symbol['name']}:")
         scope = f"@{symbol['name']}"
         for arg in symbol.get("argv", []):
             stor_arg = arg if arg.startswith("@") else f"{scope}.{arg}"
             code.append(f"STOR {stor_arg}")
-        for entry in self.code:
+        for entry in self._parsed:
             if isinstance(entry, str):
-                code.append(entry.format(**symbol))
+                code.append(entry)
+            elif isinstance(entry, tuple):
+                code.append(_render_template(entry, symbol))
             else:
-                code.extend(entry.gen_code())
+                entry.emit(code)
         if symbol["name"] == "__main__":
             code.append("HALT")
         else:
             code.append("RET")
-        return code
 
 
-class RelationalOperator:
+class RelationalOperator(CodeNode):
     """Code generator for relational operators."""
 
+    __slots__ = ("oper", "lhs", "rhs", "_true", "_false", "_jumps")
+
     def __init__(self, oper, lhs, rhs):
         """Initialize object."""
         if lhs.type == str or rhs.type == str and oper not in ["==", "<>"]:
@@ -323,8 +495,58 @@ class RelationalOperator:
         self.oper = oper
         self.lhs = lhs
         self.rhs = rhs
-        self.true = None
-        self.false = None
+        self._true = None
+        self._false = None
+        self._jumps = ()
+
+    @property
+    def true(self):
+        """Return the jump target for a true relation."""
+        return self._true
+
+    @true.setter
+    def true(self, label):
+        self._true = label
+        self.__update_jumps()
+
+    @property
+    def false(self):
+        """Return the jump target for a false relation."""
+        return self._false
+
+    @false.setter
+    def false(self, label):
+        self._false = label
+        self.__update_jumps()
+
+    def __update_jumps(self):
+        """
+        Format the jump instructions for the current targets.
+
+        This is the rule implemented for rel_op:
+
+        if true != fall and false != fall:
+          code = "ifTrue {test} goto <true>; goto {false}"
+        if true != fall and false == fall:
+          code = "ifTrue {test} goto {true}"
+        if true == fall and false != fall:
+          code = "ifFalse {testt} goto {false}"
+        else:
+          code = []
+        """
+        op_test = _REL_TEST[self.oper]
+        jumps = ()
+        if all([self._true, self._false]):
+            jumps = op_test["ifTrue"] + ("JP :{false}",)
+        elif self._true and not self._false:
+            jumps = op_test["ifTrue"]
+        elif not self._true and self._false:
+            jumps = op_test["ifFalse"]
+        true = self._true.name if self._true else None
+        false = self._false.name if self._false else None
+        self._jumps = tuple(
+            entry.format(true=true, false=false) for entry in jumps
+        )
 
     @property
     def type(self):
@@ -336,71 +558,27 @@ class RelationalOperator:
         """Return True if value is const."""
         return self.lhs.is_const and self.rhs.is_const
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        # This is the rule implemented for rel_op:
-        #
-        # if true != fall and false != fall:
-        #   code = "ifTrue {test} goto <true>; goto {false}"
-        # if true != fall and false == fall:
-        #   code = "ifTrue {test} goto {true}"
-        # if true == fall and false != fall:
-        #   code = "ifFalse {testt} goto {false}"
-        # else:
-        #   code = []
-        # code = lhs.gen_code + rhs.gen_code + code
-        #
-        test = {
-            "<": {
-                "ifTrue": ["JLESS :{true}"],
-                "ifFalse": ["JMORE :{false}", "JZ :{false}"],
-            },
-            "<=": {
-                "ifTrue": ["JLESS :{true}", "JZ :{true}"],
-                "ifFalse": ["JMORE :{false}"],
-            },
-            ">": {
-                "ifTrue": ["JMORE :{true}"],
-                "ifFalse": ["JLESS :{false}", "JZ :{false}"],
-            },
-            ">=": {
-                "ifTrue": ["JMORE :{true}", "JZ :{true}"],
-                "ifFalse": ["JLESS :{false}"],
-            },
-            "==": {
-                "ifTrue": ["JZ :{true}"],
-                "ifFalse": ["JNZ :{false}"],
-            },
-            "<>": {
-                "ifTrue": ["JNZ :{true}"],
-                "ifFalse": ["JZ :{false}"],
-            },
-        }
-
-        op_test = test[self.oper]
-        code = []
-        if all([self.true, self.false]):
-            code = op_test["ifTrue"] + ["JP :{false}"]
-        elif self.true and not self.false:
-            code = op_test["ifTrue"]
-        elif not self.true and self.false:
-            code = op_test["ifFalse"]
-        code = (
-            self.lhs.gen_code() + self.rhs.gen_code() + ["SUB", "POP"] + code
-        )
-        code = [
-            entry.format(
-                true=self.true.name if self.true else None,
-                false=self.false.name if self.false else None,
-            )
-            for entry in code
-        ]
-        return code
+    @property
+    def value(self):
+        """Return the relation result for constant operands."""
+        if not self.is_const:
+            raise InternalError("Acessing 'value' of non-const expression.")
+        return _REL_FOLD[self.oper](self.lhs.value, self.rhs.value)
 
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        self.lhs.emit(code)
+        self.rhs.emit(code)
+        code.append("SUB")
+        code.append("POP")
+        code.extend(self._jumps)
 
-class BooleanValue:
+
+class BooleanValue(CodeNode):
     """Code generation for AND, OR and NOT."""
 
+    __slots__ = ("value", "type", "is_const", "true", "false")
+
     def __init__(self, value):
         """Initialize object."""
         self.value = value
@@ -409,111 +587,153 @@ class BooleanValue:
         self.true = None
         self.false = None
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
+    def emit(self, code):
+        """Emit code for LogoVM."""
         if self.true is None and self.false is None:
-            return [f"PUSH {0 if self.value else 1}", "CMP 0"]
-        if self.value and self.true:
-            return [f"JP {self.true.gen_code()[0]}"]
-        if not self.value and self.false:
-            return [f"JP {self.false.gen_code()[0]}"]
-        return []
+            code.append(f"PUSH {0 if self.value else 1}")
+            code.append("CMP 0")
+        elif self.value and self.true:
+            code.append(f"JP :{self.true.name}")
+        elif not self.value and self.false:
+            code.append(f"JP :{self.false.name}")
 
 
-class BooleanOperator:
+class BooleanOperator(CodeNode):
     """Code generation for AND, OR and NOT."""
 
+    __slots__ = ("oper", "lhs", "rhs", "true", "false", "_folded")
+
     def __init__(self, oper, lhs, rhs=None):
-        """Initialize object."""
+        """Initialize object, folding constant operands eagerly."""
         self.oper = oper
         self.lhs = lhs
         self.rhs = rhs
-        self.type = bool
-        self.is_const = self.lhs.is_const and (
-            self.rhs is None or self.rhs.is_const
-        )
         self.true = None
         self.false = None
+        self._folded = None
+        if lhs.is_const and (rhs is None or rhs.is_const):
+            if rhs is None:
+                result = not lhs.value
+            elif oper == "AND":
+                result = lhs.value and rhs.value
+            else:
+                result = lhs.value or rhs.value
+            self._folded = BooleanValue(result)
 
+    @property
+    def type(self):
+        """Retrieve the data type of the expression."""
+        return bool
+
+    @property
+    def is_const(self):
+        """Tell if the operator folded to a constant value."""
+        return self._folded is not None
+
+    @property
     def value(self):
         """Retrieve the value of a constant boolean operator."""
-        if not self.is_const:
+        if self._folded is None:
             raise InternalError("Acessing 'value' of non-const expression.")
-        if self.rhs is None:
-            return not self.lhs.value
-        return (
-            (self.lhs and self.rhs)
-            if self.oper == "AND"
-            else (self.lhs or self.rhs)
-        )
+        return self._folded.value
 
-    def __not(self):
+    def __not(self, code):
         """NOT operator implementation."""
         self.lhs.true = self.false
         self.lhs.false = self.true
-        return self.lhs.gen_code()
+        self.lhs.emit(code)
 
-    def __and(self):
+    def __and(self, code):
         """AND operator implementation."""
         # Use fallback for true values
         self.lhs.true = None
         self.rhs.true = self.true
         self.lhs.false = self.rhs.false = self.false
-        return self.lhs.gen_code() + self.rhs.gen_code()
+        self.lhs.emit(code)
+        self.rhs.emit(code)
 
-    def __or(self):
+    def __or(self, code):
         """OR operator implementation."""
         self.lhs.true = self.rhs.true = self.true
         self.lhs.false = self.rhs.false = self.false
-        return self.lhs.gen_code() + self.rhs.gen_code()
-
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        if self.is_const:
-            value = BooleanValue(self.value)
-            value.true = self.true
-            value.false = self.false
-            return value.gen_code()
-        return {"NOT": self.__not, "AND": self.__and, "OR": self.__or}.get(
-            self.oper, lambda: []
-        )()
+        self.lhs.emit(code)
+        self.rhs.emit(code)
+
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        if self._folded is not None:
+            self._folded.true = self.true
+            self._folded.false = self.false
+            self._folded.emit(code)
+            return
+        {"NOT": self.__not, "AND": self.__and, "OR": self.__or}.get(
+            self.oper, lambda _code: None
+        )(code)
+
+
+class Label(CodeNode):
+    """A target label for a jump."""
 
+    __slots__ = ("name",)
 
-class Label:
-    """A target label for a jump."""
+    _counter = itertools.count(1)
 
     @staticmethod
     def __new_label():
         """Create a new label."""
-        count = getattr(Label.__new_label, "count", 0) + 1
-        logging.log(5, "New label: %d", count)
-        setattr(Label.__new_label, "count", count)
-        return f"_@trgt_{Label.__new_label.count}"
+        count = next(Label._counter)
+        if _TRACE:
+            logging.log(5, "New label: %d", count)
+        return f"_@trgt_{count}"
+
+    @staticmethod
+    def reset():
+        """Restart automatic label numbering for a new compile run."""
+        Label._counter = itertools.count(1)
 
     def __init__(self, label=None):
         """Initilize the label with the given name or a unique name."""
         self.name = label if label else Label.__new_label()
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        return [f":{self.name}"]
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        code.append(f":{self.name}")
+
+
+class RawInstr(CodeNode):
+    """A literal instruction wrapped as a code node."""
+
+    __slots__ = ("instr",)
+
+    def __init__(self, instr):
+        """Initialize object."""
+        self.instr = instr
+
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        code.append(self.instr)
 
 
-class CodeBlock:
+class CodeBlock(CodeNode):
     """A list of statements as a coeherent block."""
 
+    __slots__ = ("block", "_emitters")
+
     def __init__(self, block):
         """Initialize the code block."""
-        self.block = block
+        # Wrapping literal instructions here keeps the emission loop
+        # free of per-entry type checks.
+        self.block = [
+            RawInstr(entry) if isinstance(entry, str) else entry
+            for entry in block
+        ]
+        # The bound emit methods are resolved once, so emission does not
+        # rebuild a method object per entry.
+        self._emitters = [instr.emit for instr in self.block]
         # for k, v in kwargs.items():
         #     setattr(self, k, v)
 
-    def gen_code(self):
-        """Generate code for LogoVM."""
-        code = []
-        for instr in self.block:
-            if isinstance(instr, str):
-                code.append(instr)
-            else:
-                code.extend(instr.gen_code())
-        return code
+    def emit(self, code):
+        """Emit code for LogoVM."""
+        for emit_instr in self._emitters:
+            emit_instr(code)
@@ -18,43 +18,78 @@
 """Implement the compiler backend."""
 
 import logging
-import re
-
+import sys
 
 from logolang.symtable import get_symbols_by_class
 from logolang.errors import LogoLinkerError
 
+# Check the backend trace level once; refresh_trace() re-arms it after
+# the CLI configures logging.
+_TRACE = logging.getLogger().isEnabledFor(7)
+
+
+def refresh_trace():
+    """Re-evaluate the cached trace flag after logging configuration."""
+    global _TRACE  # pylint: disable=global-statement
+    _TRACE = logging.getLogger().isEnabledFor(7)
+
 
-def init_code(start):
+def init_code(start, functions):
     """Initialize code."""
-    logging.log(7, "init_code: %s", start)
+    if _TRACE:
+        logging.log(7, "init_code: %s", start)
     # .START
     code = [f".START {start}"]
 
     # .INIT
-    if any(
-        v
-        for v in get_symbols_by_class("FUNCTION").values()
-        if v["usage"] > 0 and v.get("graphics", False)
-    ):
+    if any(v.get("graphics", False) for v in functions.values()):
         code.extend(["", ".INIT 200 200 400 400"])
     # .DATA
-    symbols = [
-        sym
-        for sym in (get_symbols_by_class("VAR") or {}).values()
-        if sym["usage"] > 0
-    ]
+    variables = get_symbols_by_class("VAR") or {}
+    symbols = [sym for sym in variables.values() if sym["usage"] > 0]
     if symbols:
 
         def sym_value(sym):
             return f"{sym.get('value', sym.get('datatype', lambda: 0)())}"
 
-        logging.log(7, "DATA section.")
+        if _TRACE:
+            logging.log(7, "DATA section.")
         code.extend(["", ".DATA"])
         code.extend([f"{sym['fqsn']:<8} {sym_value(sym)}" for sym in symbols])
     return code
 
 
+def gen_function_code(name, func, functions, target_code):
+    """Emit the code of one selected function into the target code."""
+    alias = None
+    if "alias" in func:
+        func = functions.get(func["alias"])
+    if not func or (
+        not func.get("library", False) and func["code"].code is None
+    ):
+        raise LogoLinkerError(f"Undefined function: '{name}'.")
+    # fmt: off
+    if (
+        not func.get("generated", False)
+        and not func.get("internal", False)
+    ):
+        # fmt: on
+        if _TRACE:
+            logging.log(7, "Function: %s", name)
+        func_code = func.get("code")
+        if func_code:
+            func_code.emit(target_code)
+        func["generated"] = True
+        if alias:
+            alias["generated"] = True  # pylint: disable=E1137
+    elif not func.get("library"):
+        logging.warning(
+            "Function %s defined but not used:%d",
+            name,
+            func['lineno'],
+        )
+
+
 def code_gen():
     """Generate target code from 3 address code."""
     functions = {
@@ -62,45 +97,30 @@ def code_gen():
         for k, v in get_symbols_by_class("FUNCTION").items()
         if v["usage"] > 0
     }
-    logging.log(7, "Selected functions: %d", len(functions.keys()))
+    if _TRACE:
+        logging.log(7, "Selected functions: %d", len(functions.keys()))
     start = "__main__"
-    target_code = init_code(start)
+    target_code = init_code(start, functions)
     # .CODE
-    logging.log(7, "CODE section.")
+    if _TRACE:
+        logging.log(7, "CODE section.")
     target_code.extend(["", ".CODE"])
     for name, func in functions.items():
-        alias = None
-        if "alias" in func:
-            func = functions.get(func["alias"])
-        if not func or (
-            not func.get("library", False) and func["code"].code is None
-        ):
-            raise LogoLinkerError(f"Undefined function: '{name}'.")
-        # fmt: off
-        if (
-            not func.get("generated", False)
-            and not func.get("internal", False)
-        ):
-            # fmt: on
-            logging.log(7, "Function: %s", name)
-            func_code = func.get("code")
-            if func_code:
-                target_code.extend(func_code.gen_code())
-            func["generated"] = True
-            if alias:
-                alias["generated"] = True  # pylint: disable=E1137
-        elif not func.get("library"):
-            logging.warning(
-                "Function %s defined but not used:%d",
-                name,
-                func['lineno'],
-            )
+        gen_function_code(name, func, functions, target_code)
     output_code(target_code)
 
 
 def output_code(target_code):
     """Output target code."""
-    print("#--------------------------")
-    for instr in target_code:
-        ident = 0 if re.match("([.]|:|DEF)", instr) else 2
-        print(f"{' '*ident}{instr}")
+
+    def indent(instr):
+        # Directives, labels and DEF lines are not indented.
+        if instr[:1] in (".", ":") or instr[:3] == "DEF":
+            return instr
+        return "  " + instr
+
+    sys.stdout.write(
+        "#--------------------------\n"
+        + "\n".join(indent(instr) for instr in target_code)
+        + "\n"
+    )
@@ -18,7 +18,11 @@
 """Logolang compiler errors."""
 
 
-class LogoLexerError(Exception):
+class LogoError(Exception):
+    """Base class for all compiler errors."""
+
+
+class LogoLexerError(LogoError):
     """Lexer exception base class."""
 
 
@@ -38,7 +42,7 @@ class InvalidIdentifier(LogoLexerError):
         super().__init__(f"Invalid identifier:{lineno}:{identifier}")
 
 
-class LogoLinkerError(Exception):
+class LogoLinkerError(LogoError):
     """Lexer exception."""
 
     def __init__(self, msg):
@@ -46,7 +50,7 @@ class LogoLinkerError(Exception):
         super().__init__(f"Linker Error: {msg}")
 
 
-class InternalError(Exception):
+class InternalError(LogoError):
     """An invalid type was used in an expression."""
 
     def __init__(self, msg):
@@ -54,7 +58,7 @@ class InternalError(Exception):
         super().__init__(f"InternalError:{msg}")
 
 
-class LogoParserError(Exception):
+class LogoParserError(LogoError):
     """Base class for Parser errors."""
 
     def __init__(self, lineno, msg):
@@ -24,6 +24,19 @@ from ply.lex import TOKEN
 
 from logolang.errors import InvalidCharacter, InvalidIdentifier
 
+# Checking the lexer trace level once keeps logging calls out of the
+# per-token path; refresh_trace() re-arms it after the CLI configures
+# logging.
+_TRACE = logging.getLogger().isEnabledFor(3)
+_log = logging.log
+
+
+def refresh_trace():
+    """Re-evaluate the cached trace flag after logging configuration."""
+    global _TRACE  # pylint: disable=global-statement
+    _TRACE = logging.getLogger().isEnabledFor(3)
+
+
 # Characters to be ignored by lexer.
 t_ignore = " \t\r"  # pylint: disable=invalid-name
 
@@ -51,10 +64,18 @@ OPERATORS = {
     "[(]": "OPEN_PAR",
     "[)]": "CLOSE_PAR",
 }
+# Operator token names in source order; going through set(OPERATORS
+# .values()) made the token tuple order vary between runs.
+OP_TOKENS = ("PWR_OP", "ADD_OP", "MUL_OP", "OPEN_PAR", "CLOSE_PAR")
 BOOLEAN_TOKENS = ("TRUE", "FALSE", "YES", "NO")
 LOGIC_TOKENS = ("AND", "OR")
 
-tokens = tuple(RESERVED + NON_RESERVED + tuple(set(OPERATORS.values())))
+# Single keyword table so identifier classification is one dict lookup.
+KEYWORDS = {word: word for word in RESERVED}
+KEYWORDS.update({word: "BOOLEAN" for word in BOOLEAN_TOKENS})
+KEYWORDS.update({word: "LOGIC_OP" for word in LOGIC_TOKENS})
+
+tokens = RESERVED + NON_RESERVED + OP_TOKENS
 
 globals().update({f"t_{v}": k for k, v in OPERATORS.items()})
 
@@ -66,18 +87,18 @@ t_REL_OP = "==|<>|>=|<=|>|<"  # pylint: disable=invalid-name
 def t_ID(token):  # pylint: disable=invalid-name
     """Extract an identifier."""
     uppervalue = token.value.upper()
-    if uppervalue in RESERVED:
-        logging.log(3, "RESERVED: '%s'", token.value)
-        token.type = uppervalue
-    elif uppervalue in BOOLEAN_TOKENS:
-        token.value = uppervalue
-        token.type = "BOOLEAN"
-    elif uppervalue in LOGIC_TOKENS:
-        token.value = uppervalue
-        token.type = "LOGIC_OP"
-    else:
+    keyword = KEYWORDS.get(uppervalue)
+    if keyword is None:
         token.type = "ID"
-    logging.log(3, "%s:%d:'%s'", token.type, token.lexer.lineno, token.value)
+    else:
+        token.type = keyword
+        if keyword == uppervalue:
+            if _TRACE:
+                _log(3, "RESERVED: '%s'", token.value)
+        else:
+            token.value = uppervalue
+    if _TRACE:
+        _log(3, "%s:%d:'%s'", token.type, token.lexer.lineno, token.value)
     return token
 
 
@@ -85,10 +106,11 @@ def t_ID(token):  # pylint: disable=invalid-name
 def t_COLON_ID(token):  # pylint: disable=invalid-name
     """Extract an identifier with a colon."""
     identifier = token.value[1:]
-    if identifier.upper in RESERVED:
+    if identifier.upper() in RESERVED:
         raise InvalidIdentifier(token.lexer.lineno, identifier)
     token.value = identifier
-    logging.log(3, "%s:%d:'%s'", token.type, token.lexer.lineno, token.value)
+    if _TRACE:
+        _log(3, "%s:%d:'%s'", token.type, token.lexer.lineno, token.value)
     return token
 
 
@@ -99,13 +121,14 @@ def t_NUMBER(token):  # pylint: disable=invalid-name
         token.value = (float(token.value), float)
     else:
         token.value = (int(token.value), int)
-    logging.log(
-        3,
-        "NUMBER:%d:(%s, %s)",
-        token.lexer.lineno,
-        token.value,
-        type(token.value).__name__,
-    )
+    if _TRACE:
+        _log(
+            3,
+            "NUMBER:%d:(%s, %s)",
+            token.lexer.lineno,
+            token.value,
+            type(token.value).__name__,
+        )
     return token
 
 
@@ -113,20 +136,23 @@ def t_NUMBER(token):  # pylint: disable=invalid-name
 def t_STRING(token):  # pylint: disable=invalid-name
     """Extract an string."""
     token.value = (token.value, str)
-    logging.log(3, "STRING:%d:(%s, str)", token.lexer.lineno, token.value)
+    if _TRACE:
+        _log(3, "STRING:%d:(%s, str)", token.lexer.lineno, token.value)
     return token
 
 
 @TOKEN(r"[#][^\n]*")
 def t_COMMENT(token):  # pylint: disable=invalid-name
     """Ignore comments."""
-    logging.log(3, "Comment:%d:'%s'", token.lexer.lineno, token.value)
+    if _TRACE:
+        _log(3, "Comment:%d:'%s'", token.lexer.lineno, token.value)
 
 
 @TOKEN(r"\n+")
 def t_newline(token):
     """Count new lines."""
-    logging.log(3, "NL: %d", len(token.value))
+    if _TRACE:
+        _log(3, "NL: %d", len(token.value))
     # For some unknown reason, new lines are being doubled
     token.lexer.lineno += len(token.value)
 
@@ -0,0 +1,181 @@
+# This file is part of logolang
+#
+# Copyright (C) 2022 Rafael Guterres Jeffman
+#
+# This software is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This software is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this software.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Logo Compiler Lexer based on a single precompiled master regex.
+
+This scanner produces the same token stream as the PLY lexer without
+PLY's per-token rule dispatch.  The rules are combined into one
+alternation in PLY's own matching order: function rules in definition
+order, then string rules by decreasing pattern length.
+"""
+
+from functools import lru_cache
+
+import logging
+import re
+
+from logolang.lexer import (  # pylint: disable=unused-import # noqa: F401
+    KEYWORDS,
+    OPERATORS,
+    RESERVED,
+    t_ASSIGN_OP,
+    t_REL_OP,
+    tokens,
+)
+from logolang.errors import InvalidCharacter, InvalidIdentifier
+
+# Checking the lexer trace level once keeps logging calls out of the
+# per-token path; refresh_trace() re-arms it after the CLI configures
+# logging.
+_TRACE = logging.getLogger().isEnabledFor(3)
+_log = logging.log
+
+
+def refresh_trace():
+    """Re-evaluate the cached trace flag after logging configuration."""
+    global _TRACE  # pylint: disable=global-statement
+    _TRACE = logging.getLogger().isEnabledFor(3)
+
+
+# Characters skipped between tokens.
+_IGNORE = " \t\r"
+
+_RULES = (
+    ("ID", r"[_a-zA-Z][_a-zA-Z0-9]*"),
+    ("COLON_ID", r"[:][_a-zA-Z][_a-zA-Z0-9]*"),
+    ("NUMBER", r"[+-]?\d+(?:[.]\d*)?"),
+    ("STRING", r"'[^']*'|\"[^\"]*\""),
+    ("COMMENT", r"[#][^\n]*"),
+    ("newline", r"\n+"),
+) + tuple(
+    sorted(
+        [("REL_OP", t_REL_OP), ("ASSIGN_OP", t_ASSIGN_OP)]
+        + [(name, pattern) for pattern, name in OPERATORS.items()],
+        key=lambda rule: len(rule[1]),
+        reverse=True,
+    )
+)
+
+_MASTER = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _RULES)
+)
+
+
+@lru_cache(maxsize=4096)
+def _classify(value):
+    """Classify an identifier lexeme, returning (type, value)."""
+    upper = value.upper()
+    keyword = KEYWORDS.get(upper)
+    if keyword is None:
+        return ("ID", value)
+    if keyword == upper:
+        # Reserved words keep their original spelling.
+        return (keyword, value)
+    return (keyword, upper)
+
+
+def _convert(kind, value, lineno):
+    """Convert a raw lexeme into its final token type and value."""
+    if kind == "ID":
+        return _classify(value)
+    if kind == "COLON_ID":
+        identifier = value[1:]
+        if identifier.upper() in RESERVED:
+            raise InvalidIdentifier(lineno, identifier)
+        return (kind, identifier)
+    if kind == "NUMBER":
+        if "." in value:
+            return (kind, (float(value), float))
+        return (kind, (int(value), int))
+    if kind == "STRING":
+        return (kind, (value, str))
+    return (kind, value)
+
+
+class Token:  # pylint: disable=too-few-public-methods
+    """A lexer token, attribute-compatible with ply.lex.LexToken."""
+
+    __slots__ = ("type", "value", "lineno", "lexpos", "lexer")
+
+    def __init__(self, toktype, value, lineno, lexpos, lexer_object):
+        """Initialize all token attributes."""
+        self.type = toktype
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+        self.lexer = lexer_object
+
+    def __repr__(self):
+        """Retrieve a string representation of the token."""
+        return f"Token({self.type},{self.value!r},{self.lineno})"
+
+
+class FastLexer:
+    """Tokenizer object with the interface ply.yacc expects."""
+
+    __slots__ = ("data", "pos", "lineno")
+
+    def __init__(self):
+        """Initialize an empty tokenizer."""
+        self.data = ""
+        self.pos = 0
+        self.lineno = 1
+
+    def input(self, data):
+        """Set the source text to tokenize."""
+        self.data = data
+        self.pos = 0
+        self.lineno = 1
+
+    def token(self):
+        """Return the next token, or None at end of input."""
+        data = self.data
+        size = len(data)
+        pos = self.pos
+        while pos < size:
+            if data[pos] in _IGNORE:
+                pos += 1
+                continue
+            match = _MASTER.match(data, pos)
+            if match is None:
+                self.pos = pos
+                raise InvalidCharacter(self.lineno, data[pos])
+            kind = match.lastgroup
+            value = match.group()
+            pos = match.end()
+            if kind == "newline":
+                if _TRACE:
+                    _log(3, "NL: %d", len(value))
+                self.lineno += len(value)
+                continue
+            if kind == "COMMENT":
+                if _TRACE:
+                    _log(3, "Comment:%d:'%s'", self.lineno, value)
+                continue
+            kind, value = _convert(kind, value, self.lineno)
+            self.pos = pos
+            if _TRACE:
+                _log(3, "%s:%d:'%s'", kind, self.lineno, value)
+            return Token(kind, value, self.lineno, match.start(), self)
+        self.pos = pos
+        return None
+
+
+def lexer():
+    """Create a new lexer object."""
+    return FastLexer()
@@ -17,150 +17,188 @@
 
 """Logolang standard library."""
 
-from logolang.symtable import add_symbol, push_scope, pop_scope
-from logolang.codegen import FunctionDefinition
+from collections import namedtuple
 
+from logolang.symtable import (
+    add_new_symbol,
+    push_scope,
+    pop_scope,
+    snapshot_state,
+    restore_state,
+)
+from logolang.codegen import FunctionDefinition, Label
 
-__standard_library = {
-    "PRINT": {
-        "library": True,
-        "internal": True,
-        "reverse_args": True,
-        "target": "WRITE",
-    },
-    "TYPEIN": {
-        "library": True,
-        "internal": True,
-        "inout": "out",
-        "target": "READ",
-        "postcode": ["STOR {params[0].name}"],
-    },
-    "RANDOM": {
-        "library": True,
-        "datatype": int,
-        "is_const": False,
-        "code": ["RAND", "PUSH 10", "MUL", "TRUNC"],
-    },
-    "FORWARD": {
-        "library": True,
-        "graphics": True,
-        "args": 1,
-        "argv": ["length"],
-        "uses": ["_@ang"],
-        "code": ["LOAD _@ang", "LOAD {argv[0]}", "CALL MOVE"],
-    },
-    "BACKWARD": {
-        "library": True,
-        "graphics": True,
-        "args": 1,
-        "argv": ["length"],
-        "uses": ["_@ang"],
-        "code": [
-            "LOAD _@ang",
-            "PUSH 180",
-            "ADD",
-            "LOAD {argv[0]}",
-            "CALL MOVE",
-        ],
-    },
-    "RIGHT": {
-        "library": True,
-        "graphics": True,
-        "args": 1,
-        "argv": ["angle"],
-        "uses": ["_@ang"],
-        "code": ["LOAD _@ang", "LOAD {argv[0]}", "SUB", "STOR _@ang"],
-    },
-    "LEFT": {
-        "library": True,
-        "graphics": True,
-        "args": 1,
-        "argv": ["angle"],
-        "uses": ["_@ang"],
-        "code": ["LOAD _@ang", "LOAD {argv[0]}", "ADD", "STOR _@ang"],
-    },
-    "PENUP": {
-        "library": True,
-        "graphics": True,
-        "args": 0,
-        "argv": [],
-        "code": ["UNSET 0"],
-    },
-    "PENDOWN": {
-        "library": True,
-        "graphics": True,
-        "args": 0,
-        "argv": [],
-        "code": ["SET 0"],
-    },
-    "HEADING": {
-        "library": True,
-        "graphics": True,
-        "args": 0,
-        "argv": [],
-        "uses": ["_@ang"],
-        "code": ["LOAD _@ang"],
-    },
-    "SETXY": {
-        "library": True,
-        "graphics": True,
-        "args": 2,
-        "argv": ["x", "y"],
-        "code": ["LOAD {argv[0]}", "LOAD {argv[1]}", "MVTO"],
-    },
-    "WIPECLEAN": {
-        "library": True,
-        "graphics": True,
-        "target": "CLRSCR",
-    },
-    "FO": {
-        "library": True,
-        "graphics": True,
-        "alias": "FORWARD",
-    },
-    "BW": {
-        "library": True,
-        "graphics": True,
-        "alias": "BACKWARD",
-    },
-    "RT": {
-        "library": True,
-        "graphics": True,
-        "alias": "RIGHT",
-    },
-    "LT": {
-        "library": True,
-        "graphics": True,
-        "alias": "LEFT",
-    },
-    "PU": {
-        "library": True,
-        "graphics": True,
-        "alias": "PENUP",
-    },
-    "PD": {
-        "library": True,
-        "graphics": True,
-        "alias": "PENDOWN",
-    },
-    "WC": {
-        "library": True,
-        "graphics": True,
-        "alias": "WIPECLEAN",
-    },
-}
+# Description of one library function.  Fields left as None are simply
+# not set on the resulting symbol, matching the sparse per-entry dicts
+# this table replaces.
+StdLibSpec = namedtuple(
+    "StdLibSpec",
+    [
+        "library",
+        "internal",
+        "graphics",
+        "reverse_args",
+        "inout",
+        "target",
+        "datatype",
+        "is_const",
+        "args",
+        "argv",
+        "uses",
+        "code",
+        "postcode",
+        "alias",
+    ],
+    defaults=(None,) * 14,
+)
+
+
+_STDLIB_SPECS = (
+    (
+        "PRINT",
+        StdLibSpec(
+            library=True, internal=True, reverse_args=True, target="WRITE"
+        ),
+    ),
+    (
+        "TYPEIN",
+        StdLibSpec(
+            library=True,
+            internal=True,
+            inout="out",
+            target="READ",
+            postcode=("STOR {params[0].name}",),
+        ),
+    ),
+    (
+        "RANDOM",
+        StdLibSpec(
+            library=True,
+            datatype=int,
+            is_const=False,
+            code=("RAND", "PUSH 10", "MUL", "TRUNC"),
+        ),
+    ),
+    (
+        "FORWARD",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=1,
+            argv=["length"],
+            uses=["_@ang"],
+            code=("LOAD _@ang", "LOAD {argv[0]}", "CALL MOVE"),
+        ),
+    ),
+    (
+        "BACKWARD",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=1,
+            argv=["length"],
+            uses=["_@ang"],
+            code=(
+                "LOAD _@ang",
+                "PUSH 180",
+                "ADD",
+                "LOAD {argv[0]}",
+                "CALL MOVE",
+            ),
+        ),
+    ),
+    (
+        "RIGHT",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=1,
+            argv=["angle"],
+            uses=["_@ang"],
+            code=("LOAD _@ang", "LOAD {argv[0]}", "SUB", "STOR _@ang"),
+        ),
+    ),
+    (
+        "LEFT",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=1,
+            argv=["angle"],
+            uses=["_@ang"],
+            code=("LOAD _@ang", "LOAD {argv[0]}", "ADD", "STOR _@ang"),
+        ),
+    ),
+    (
+        "PENUP",
+        StdLibSpec(
+            library=True, graphics=True, args=0, argv=[], code=("UNSET 0",)
+        ),
+    ),
+    (
+        "PENDOWN",
+        StdLibSpec(
+            library=True, graphics=True, args=0, argv=[], code=("SET 0",)
+        ),
+    ),
+    (
+        "HEADING",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=0,
+            argv=[],
+            uses=["_@ang"],
+            code=("LOAD _@ang",),
+        ),
+    ),
+    (
+        "SETXY",
+        StdLibSpec(
+            library=True,
+            graphics=True,
+            args=2,
+            argv=["x", "y"],
+            code=("LOAD {argv[0]}", "LOAD {argv[1]}", "MVTO"),
+        ),
+    ),
+    ("WIPECLEAN", StdLibSpec(library=True, graphics=True, target="CLRSCR")),
+    ("FO", StdLibSpec(library=True, graphics=True, alias="FORWARD")),
+    ("BW", StdLibSpec(library=True, graphics=True, alias="BACKWARD")),
+    ("RT", StdLibSpec(library=True, graphics=True, alias="RIGHT")),
+    ("LT", StdLibSpec(library=True, graphics=True, alias="LEFT")),
+    ("PU", StdLibSpec(library=True, graphics=True, alias="PENUP")),
+    ("PD", StdLibSpec(library=True, graphics=True, alias="PENDOWN")),
+    ("WC", StdLibSpec(library=True, graphics=True, alias="WIPECLEAN")),
+)
+
+
+# Symbol table state captured right after the first library
+# initialization; later runs restore it instead of rebuilding.
+_stdlib_snapshot = None  # pylint: disable=invalid-name
 
 
 def initialize_standard_library():
     """Initialize the Logo standard library."""
-    add_symbol("_@ang", "VAR", lineno=-1)
-    for name, data in __standard_library.items():
-        sym = add_symbol(name, "FUNCTION", lineno=-1, **data)
-        sym["code"] = FunctionDefinition(sym, data.get("code", []))
+    # pylint: disable=global-statement
+    global _stdlib_snapshot
+    if _stdlib_snapshot is not None:
+        restore_state(_stdlib_snapshot)
+        Label.reset()
+        return
+    add_new_symbol("_@ang", "VAR", lineno=-1)
+    for name, spec in _STDLIB_SPECS:
+        data = {
+            field: value
+            for field, value in zip(spec._fields, spec)
+            if value is not None
+        }
+        sym = add_new_symbol(name, "FUNCTION", lineno=-1, **data)
+        sym["code"] = FunctionDefinition(sym, spec.code or ())
         push_scope(name)
         new_args = []
         for arg in sym.get("argv", []):
-            symarg = add_symbol(arg, "VAR", lineno=-1)
+            symarg = add_new_symbol(arg, "VAR", lineno=-1)
             symarg["fqsn"] = (
                 f"{symarg['scope']}.{arg}"
                 if symarg["scope"] and not arg.startswith("@")
@@ -169,3 +207,4 @@ def initialize_standard_library():
             new_args.append(symarg["fqsn"])
         sym["argv"] = new_args
         pop_scope()
+    _stdlib_snapshot = snapshot_state()
@@ -17,90 +17,212 @@
 
 """Logo Compiler Symbol Table implementation."""
 
+import copy
+import functools
+import itertools
 import logging
+
 from logolang.errors import SymbolRedeclaration, InternalError
 
+# Check the parser trace level once, so symbol-table updates do not pay
+# for disabled logging calls; refresh_trace() re-arms it after the CLI
+# configures logging.
+_TRACE = logging.getLogger().isEnabledFor(5)
+
+
+def refresh_trace():
+    """Re-evaluate the cached trace flag after logging configuration."""
+    global _TRACE  # pylint: disable=global-statement
+    _TRACE = logging.getLogger().isEnabledFor(5)
+
+
+class _SymTable:  # pylint: disable=too-few-public-methods
+    """
+    Storage for the compiler symbol table.
+
+    A slotted class is used instead of a dict so the hot lookup paths
+    access the scope stack and global symbol maps through attribute
+    slots rather than hashed subscripts.
+    """
+
+    __slots__ = ("scopes", "functions", "variables", "name_index")
+
+    def __init__(self):
+        self.scopes = []
+        self.functions = {}
+        self.variables = {}
+        self.name_index = {}
+
+    def by_class(self, cls):
+        """Return the global symbol map for a symbol class."""
+        return self.functions if cls == "FUNCTION" else self.variables
+
+
+__symtable = _SymTable()
+
+# Symbol lookups are case insensitive; the upper-cased form of every
+# name seen is cached so each distinct spelling is converted only once.
+_UPPER_CACHE = {}
+
+# Fully qualified symbol names, keyed by (scope, name); the same
+# qualified name is requested once per call site otherwise.
+_FQSN_CACHE = {}
+
 
-__symtable = {"scopes": [], "FUNCTION": {}, "VAR": {}}
+def _up(symbol):
+    """Return the cached upper-case lookup key for a symbol name."""
+    key = _UPPER_CACHE.get(symbol)
+    if key is None:
+        key = _UPPER_CACHE[symbol] = symbol.upper()
+    return key
 
 
 def get_symbols_by_class(cls):
     """Return all the symbols of a specific class."""
-    return __symtable[cls]
+    return __symtable.by_class(cls)
+
+
+def snapshot_state():
+    """Return a deep copy of the current symbol table state."""
+    return copy.deepcopy(__symtable)
+
+
+def restore_state(state):
+    """Replace the symbol table state with a copy of a snapshot."""
+    # pylint: disable=global-statement
+    global __symtable
+    __symtable = copy.deepcopy(state)
+    _label_counters.clear()
+    resolve_function.cache_clear()
+
+
+# Per-pattern label counters; itertools.count increments at C level.
+_label_counters = {}
 
 
 def new_label(pattern):
     """Create a new unique label for the given pattern."""
-    counter = 1 + getattr(new_label, pattern, 0)
-    setattr(new_label, pattern, counter)
-    return f"_@{pattern}_{counter}"
+    counter = _label_counters.get(pattern)
+    if counter is None:
+        counter = _label_counters[pattern] = itertools.count(1)
+    return f"_@{pattern}_{next(counter)}"
 
 
 def push_scope(name=None):
     """Push a new scope to the symbol table."""
-
-    def new_scope(name):
-        return {"name": name, "symbols": {}}
-
-    __symtable["scopes"].append(new_scope(name))
+    scopes = __symtable.scopes
+    # Each scope carries its full dotted name, so current_scope() does
+    # not have to rebuild it on every symbol insertion.
+    prefix = scopes[-1]["_fqprefix"] if scopes else ""
+    if name:
+        prefix = f"{prefix}.@{name}" if prefix else f"@{name}"
+    scopes.append({"name": name, "symbols": {}, "_fqprefix": prefix})
+    resolve_function.cache_clear()
 
 
 def pop_scope():
     """Pop the last scope, proccess, and return it."""
-    scope = __symtable["scopes"].pop()
-    for _, symbol in scope["symbols"].items():
-        __symtable[symbol["type"]][symbol["fqsn"]] = symbol
+    name_index = __symtable.name_index
+    scope = __symtable.scopes.pop()
+    for key, symbol in scope["symbols"].items():
+        __symtable.by_class(symbol["type"])[symbol["fqsn"]] = symbol
+        indices = name_index[key]
+        indices.pop()
+        if not indices:
+            del name_index[key]
+    resolve_function.cache_clear()
     return scope
 
 
 def current_scope():
     """Retrieve the full name of the current scope."""
-    return ".".join(
-        f"@{scope['name']}" for scope in __symtable["scopes"] if scope["name"]
-    )
+    scopes = __symtable.scopes
+    return scopes[-1]["_fqprefix"] if scopes else ""
 
 
 def get_symbol(symbol, scopename=None, symtype=None):
     """Get a symbol from the symbol table."""
-    symbol = symbol.upper()
-    for scope in __symtable["scopes"][::-1]:
+    table = __symtable
+    symbol = _up(symbol)
+    scopes = table.scopes
+    # The name index maps a symbol to the scopes declaring it, so the
+    # lookup does not have to walk the whole scope stack.
+    for index in reversed(table.name_index.get(symbol, ())):
+        scope = scopes[index]
         if scopename is None or scopename == scope["name"]:
-            sym = scope["symbols"].get(symbol)
-            if sym:
-                if symtype is None or symtype == sym["type"]:
-                    return sym
+            sym = scope["symbols"][symbol]
+            if symtype is None or symtype == sym["type"]:
+                return sym
     if symtype is not None and scopename is None:
-        return __symtable[symtype].get(symbol)
+        if symtype == "FUNCTION":
+            return table.functions.get(symbol)
+        return table.variables.get(symbol)
     return None
 
 
-def add_symbol(symbol, symtype, lineno=-1, **kwargs):
-    """Add a symbol to the symbol table."""
+# Results are cached until the scope stack or the set of visible
+# symbols changes; every change site calls cache_clear().
+@functools.lru_cache(maxsize=None)
+def resolve_function(symbol):
+    """Resolve a symbol by name, following alias chains."""
     sym = get_symbol(symbol)
-    if sym:
-        if sym["type"] != symtype:
-            raise SymbolRedeclaration(lineno, symbol, sym["lineno"])
-        if sym["lineno"] >= 0:
-            if "lineno" in kwargs:
-                del kwargs["lineno"]
-            if "value" in sym and "value" in kwargs:
-                del kwargs["value"]
-        if "name" in kwargs:
-            raise InternalError("Cannot modify object 'name'.")
-        logging.log(5, "Updating symbol:%s:%s", symbol, repr(kwargs))
-        sym.update(kwargs)
+    if sym is None:
+        return None
+    if "alias" in sym:
+        return resolve_function(sym["alias"])
+    return sym
+
+
+def _qualify_args(sym):
+    """Rewrite argv/uses entries to their fully qualified names."""
+    arg_scope = sym.get("_arg_scope")
+    if arg_scope is None:
+        arg_scope = f"@{sym['name']}"
+        if sym["scope"]:
+            arg_scope = sym["scope"] + arg_scope
+        sym["_arg_scope"] = arg_scope
+    arg_prefix = arg_scope + "."
+    sym["argv"] = [
+        arg_prefix + arg if not arg.startswith("@") else arg
+        for arg in sym.get("argv", [])
+    ]
+    # Qualify `uses` entries to their final names as well, so usage
+    # tracking never has to build fqsn strings per call.
+    uses = sym.get("uses")
+    if uses and sym["scope"]:
+        scope = ".@".join(lvl for lvl in [sym["scope"], sym["name"]] if lvl)
+        prefix = f"@{scope}."
+        sym["uses"] = [
+            arg if arg.startswith("@") else prefix + arg for arg in uses
+        ]
+    sym["_argv_resolved"] = True
+    return sym
+
+
+def add_new_symbol(symbol, symtype, lineno=-1, **kwargs):
+    """
+    Add a symbol known not to be declared yet.
+
+    Skips the declaration lookup add_symbol performs; callers must
+    guarantee the name is new, as library initialization does.
+    """
+    sym_scope = current_scope()
+    if sym_scope:
+        fqsn = _FQSN_CACHE.get((sym_scope, symbol))
+        if fqsn is None:
+            fqsn = _FQSN_CACHE[(sym_scope, symbol)] = sym_scope + "." + symbol
     else:
-        sym_scope = current_scope()
-        fqsn = f"{sym_scope}.{symbol}" if sym_scope else symbol
-        sym = {
-            "name": symbol,
-            "type": symtype,
-            "lineno": lineno,
-            "usage": 0,
-            "scope": sym_scope,
-            "fqsn": fqsn,
-            **kwargs,
-        }
+        fqsn = symbol
+    sym = {
+        "name": symbol,
+        "type": symtype,
+        "lineno": lineno,
+        "usage": 0,
+        "scope": sym_scope,
+        "fqsn": fqsn,
+        **kwargs,
+    }
+    if _TRACE:
         logging.log(
             5,
             "Adding symbol:%s:%s:%d:%s",
@@ -109,40 +231,81 @@ def add_symbol(symbol, symtype, lineno=-1, **kwargs):
             lineno,
             repr(kwargs),
         )
-        __symtable["scopes"][-1]["symbols"][symbol.upper()] = sym
+    key = _up(symbol)
+    scopes = __symtable.scopes
+    scopes[-1]["symbols"][key] = sym
+    __symtable.name_index.setdefault(key, []).append(len(scopes) - 1)
+    resolve_function.cache_clear()
+    return _qualify_args(sym)
 
-    arg_scope = f"@{sym['name']}"
-    if sym["scope"]:
-        arg_scope = sym["scope"] + arg_scope
-    args = [
-        arg_scope + f".{arg}" if not arg.startswith("@") else arg
-        for arg in sym.get("argv", [])
-    ]
-    sym["argv"] = args
+
+def add_symbol(symbol, symtype, lineno=-1, **kwargs):
+    """Add a symbol to the symbol table."""
+    sym = get_symbol(symbol)
+    if not sym:
+        return add_new_symbol(symbol, symtype, lineno, **kwargs)
+    if sym["type"] != symtype:
+        raise SymbolRedeclaration(lineno, symbol, sym["lineno"])
+    if sym["lineno"] >= 0:
+        kwargs.pop("lineno", None)
+        if "value" in sym:
+            kwargs.pop("value", None)
+    if "name" in kwargs:
+        raise InternalError("Cannot modify object 'name'.")
+    if _TRACE:
+        logging.log(5, "Updating symbol:%s:%s", symbol, repr(kwargs))
+    sym.update(kwargs)
+    # Only a redeclaration changing alias/argv/uses can invalidate the
+    # cached usage closure; plain updates (e.g. on every call site)
+    # must keep it, or the cache never pays off.
+    if "alias" in kwargs or "argv" in kwargs or "uses" in kwargs:
+        sym.pop("_usage_targets", None)
+    # Only (re)qualify argv/uses when they may actually have changed;
+    # updates without them would otherwise rebuild the same lists on
+    # every call site.
+    if "argv" in kwargs or "uses" in kwargs or "_argv_resolved" not in sym:
+        _qualify_args(sym)
     return sym
 
 
+def _usage_targets(sym, symbol):
+    """
+    Collect, and cache, every symbol a usage of `sym` touches.
+
+    The closure over alias, argv and uses is stable once a symbol is
+    declared, so it is resolved to symbol entries only once; further
+    usage increases are a flat walk over the cached entries.
+    """
+    targets = sym.get("_usage_targets")
+    if targets is not None:
+        return targets
+    targets = [sym]
+    if "alias" in sym:
+        aliased = get_symbol(sym["alias"])
+        if aliased is None:
+            raise InternalError(f"Increasing unknown symbol usage: {symbol}")
+        targets.append(aliased)
+        sym, cached = aliased, sym
+    else:
+        cached = sym
+    for arg in sym.get("argv", []) + sym.get("uses", []):
+        target = get_symbol(arg, symtype="VAR")
+        if target is None:
+            target = __symtable.variables.get(arg)
+            if target is None:
+                raise InternalError(f"Increasing unknown symbol usage: {arg}")
+        targets.extend(_usage_targets(target, arg))
+    cached["_usage_targets"] = targets
+    return targets
+
+
 def increase_symbol_usage(symbol, symtype=None):
     """Increase symbol usage."""
     sym = get_symbol(symbol, symtype=symtype)
     if sym is None:
         if symtype is not None:
-            sym = __symtable[symtype].get(symbol)
-        if sym is None:
-            raise InternalError(f"Increasing unknown symbol usage: {symbol}")
-    sym["usage"] += 1
-    if "alias" in sym:
-        sym = get_symbol(sym["alias"])
+            sym = __symtable.by_class(symtype).get(symbol)
         if sym is None:
             raise InternalError(f"Increasing unknown symbol usage: {symbol}")
-        sym["usage"] += 1
-
-    for arg in sym.get("argv", []) + sym.get("uses", []):
-        if sym["scope"] and not arg.startswith("@"):
-            scope = ".@".join(
-                lvl for lvl in [sym["scope"], sym["name"]] if lvl
-            )
-            fqsn = f"@{scope}.{arg}"
-            increase_symbol_usage(fqsn, symtype="VAR")
-        else:
-            increase_symbol_usage(arg, symtype="VAR")
+    for target in _usage_targets(sym, symbol):
+        target["usage"] += 1
@@ -22,10 +22,14 @@ import logging
 from ply import yacc
 
 from logolang.lexer import (  # pylint: disable=unused-import # noqa: F401
-    lexer,
     tokens,
 )
 
+try:
+    from logolang.lexer_fast import lexer
+except ImportError:  # pragma: no cover
+    from logolang.lexer import lexer
+
 from logolang import codegen
 from logolang.symtable import (
     push_scope,
@@ -40,6 +44,19 @@ from logolang.errors import InvalidExpressionType, InternalError
 parser_error = True  # pylint: disable=invalid-name
 __parser = None  # pylint: disable=invalid-name
 
+# ConstValue is immutable, so small integer constants produced by the
+# parser itself (e.g. PRINT argument counts) can be shared.
+_CONST_INT_CACHE = {}
+
+
+def _const_int(value):
+    """Return a shared ConstValue for an integer constant."""
+    const = _CONST_INT_CACHE.get(value)
+    if const is None:
+        const = _CONST_INT_CACHE[value] = codegen.ConstValue(value, int)
+    return const
+
+
 precedence = (
     ("nonassoc", "LOGIC_OP"),
     ("right", "NOT"),
@@ -61,7 +78,7 @@ def p_program(p):  # noqa: D200,D403,D400,D415
 
 def p_more_statements_or_decls(_p):  # noqa: D200,D205,D403,D400,D415
     """
-    more_statements_or_decls : statement_or_decl more_statements_or_decls
+    more_statements_or_decls : more_statements_or_decls statement_or_decl
                              | empty
     """
 
@@ -93,29 +110,33 @@ def p_primitive_signature(p):  # noqa: D200,D403,D400,D415
     primitive_signature : TO ID opt_args
     """
     p[0] = add_symbol(
-        p[2], "FUNCTION", lineno=p.lineno(2), argv=p[3][::-1], argc=len(p[3])
+        p[2], "FUNCTION", lineno=p.lineno(2), argv=p[3], argc=len(p[3])
     )
     push_scope(p[2])
 
 
 def p_opt_args(p):  # noqa: D200,D205,D403,D400,D415
     """
-    opt_args : COLON_ID opt_args
+    opt_args : opt_args COLON_ID
              | empty
     """
-    if p[1] is not None:
-        p[2].append(p[1])
-        p[0] = p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
 
 def p_body(p):  # noqa: D200,D205,D403,D400,D415
     """
-    body : statement body
+    body : body statement
          | empty
     """
-    p[0] = ([p[1]] + p[2]) if p[1] is not None else []
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
+    else:
+        p[0] = []
 
 
 def p_statement(p):  # noqa: D200,D205,D403,D400,D415
@@ -137,7 +158,10 @@ def p_primitive_call_print(p):  # noqa: D200,D403,D400,D415
     if sym is None:
         raise InternalError("PRINT function is not defined.")
     increase_symbol_usage(p[1])
-    length = codegen.ConstValue(1 + len(p[3]), int)
+    length = _const_int(1 + len(p[3]))
+    # Parameters are passed innermost first, as the right-recursive
+    # rules used to produce them.
+    p[3].reverse()
     p[0] = codegen.CallProcedure(
         sym,
         [codegen.CallParam(length, int)] + p[3] + [codegen.CallParam(p[2])],
@@ -163,17 +187,18 @@ def p_primitive_call(p):  # noqa: D200,D403,D400,D415
     """
     sym = add_symbol(p[1], "FUNCTION")
     increase_symbol_usage(sym["name"])
+    p[2].reverse()
     p[0] = codegen.CallProcedure(sym, p[2])
 
 
 def p_opt_params(p):  # noqa: D200,D205,D403,D400,D415
     """
-    opt_params : expression opt_params
+    opt_params : opt_params expression
                | empty
     """
-    if p[1] is not None:
-        p[2].append(p[1])
-        p[0] = p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -229,7 +254,7 @@ def p_expression_uminus(p):  # noqa: D200,D403,D400,D415
     """
     if p[2].type not in [int, float]:
         raise InvalidExpressionType(p.lineno(1), p[2].type)
-    p[0] = codegen.BinaryOperator("*", codegen.ConstValue(-1, int), p[2])
+    p[0] = codegen.BinaryOperator("*", _const_int(-1), p[2])
 
 
 def p_expression_id(p):  # noqa: D200,D403,D400,D415
@@ -375,7 +400,17 @@ def p_error(p):
 
 def parse_program(source):
     """Parse LogoASM program."""
-    # global __parser  # pylint: disable=global-variable-undefined,invalid-name
-    # Parse program
-    __parser = yacc.yacc(start="program", debug=True)
+    global __parser  # pylint: disable=global-statement,invalid-name
+    if __parser is None:
+        # Building the LALR tables is by far the most expensive part of
+        # a small compile; build the parser once and reuse it.  Table
+        # files are not written: PLY artifacts are treated as
+        # disposable in this project.  The null errorlog keeps PLY's
+        # known grammar warnings off stderr on every compile.
+        __parser = yacc.yacc(
+            start="program",
+            debug=False,
+            write_tables=False,
+            errorlog=yacc.NullLogger(),
+        )
     return __parser.parse(source, lexer=lexer(), tracking=False)